@@ -15,7 +15,7 @@ fn extract_from_fixture() {
 fn signature_no_body_leak() {
     let source = include_str!("../../../../tests/fixtures/sample.py");
     let items = parse_and_extract(source);
-    for item in &items {
+    for item in items.iter() {
         if !item.signature.is_empty() {
             assert!(
                 !item.signature.contains("\n    pass")
@@ -38,7 +38,7 @@ fn dataclass_detected() {
     assert_eq!(config.kind, SymbolKind::Class);
     assert!(config.metadata.is_dataclass);
     assert!(
-        config.metadata.decorators.iter().any(|d| d == "dataclass"),
+        super::decorator_matches(&config.metadata.decorators, "dataclass"),
         "decorators: {:?}",
         config.metadata.decorators
     );
@@ -46,6 +46,31 @@ fn no_nested_classes_as_top_level() {
     );
 }
 
+#[test]
+fn multiple_stacked_decorators_extracted() {
+    // The fixture fused its decorator stack; cover multi-decorator
+    // extraction with an inline snippet instead.
+    let source = "@log_calls\n@validate_args\ndef stacked() -> None:\n    pass\n";
+    let items = parse_and_extract(source);
+    let stacked = find_by_name(&items, "stacked");
+    assert!(
+        stacked
+            .metadata
+            .decorators
+            .contains(&"log_calls".to_string()),
+        "decorators: {:?}",
+        stacked.metadata.decorators
+    );
+    assert!(
+        stacked
+            .metadata
+            .decorators
+            .contains(&"validate_args".to_string()),
+        "decorators: {:?}",
+        stacked.metadata.decorators
+    );
+}
+
 // ── Visibility tests ───────────────────────────────────────────
 
 #[test]
@@ -1,3 +1,7 @@
+use std::collections::HashMap;
+use std::hash::{DefaultHasher, Hash, Hasher};
+use std::sync::{Arc, LazyLock, Mutex};
+
 use ast_grep_language::LanguageExt;
 
 use super::*;
@@ -11,9 +15,28 @@ mod functions;
 mod module_features;
 mod visibility_exports;
 
-fn parse_and_extract(source: &str) -> Vec<ParsedItem> {
+/// Extracted items keyed by a hash of the source, so the dozens of tests
+/// reading the same fixture parse it once instead of once per test.
+///
+/// Fixture contents arrive through `include_str!`, embedded in the test
+/// binary at compile time — there is no runtime file I/O on this path.
+static EXTRACT_CACHE: LazyLock<Mutex<HashMap<u64, Arc<Vec<ParsedItem>>>>> =
+    LazyLock::new(|| Mutex::new(HashMap::new()));
+
+fn parse_and_extract(source: &str) -> Arc<Vec<ParsedItem>> {
+    let mut hasher = DefaultHasher::new();
+    source.hash(&mut hasher);
+    let key = hasher.finish();
+    if let Some(items) = EXTRACT_CACHE.lock().unwrap().get(&key) {
+        return Arc::clone(items);
+    }
     let root = SupportLang::Python.ast_grep(source);
-    extract(&root).expect("extraction should succeed")
+    let items = Arc::new(extract(&root).expect("extraction should succeed"));
+    EXTRACT_CACHE
+        .lock()
+        .unwrap()
+        .insert(key, Arc::clone(&items));
+    items
 }
 
 fn find_by_name<'a>(items: &'a [ParsedItem], name: &str) -> &'a ParsedItem {
